@@ -4,6 +4,8 @@ import asyncio
 import os
 from datetime import datetime, timedelta
 
+from aiohttp import ClientSession, TCPConnector
+
 from python_frank_energie import FrankEnergie
 from python_frank_energie.frank_energie import FrankCountry
 
@@ -14,35 +16,56 @@ async def main():
     tomorrow = today + timedelta(days=1)
     day_after_tomorrow = today + timedelta(days=2)
 
-    async with FrankEnergie(country=FrankCountry.Belgium) as fe:
+    # Share one session (and its keep-alive connections) between both clients
+    async with ClientSession(
+        connector=TCPConnector(limit=20, keepalive_timeout=300, ttl_dns_cache=300)
+    ) as session:
+        await fetch(session, today, tomorrow, day_after_tomorrow)
+
+
+async def fetch(session, today, tomorrow, day_after_tomorrow):
+    """Fetch and print data from Frank energie using the given session."""
+    async with FrankEnergie(session, country=FrankCountry.Belgium) as fe:
 
-        prices_today = await fe.prices(today, tomorrow)
-        prices_tomorrow = await fe.prices(tomorrow, day_after_tomorrow)
+        prices_today, prices_tomorrow = await fe.prices_batch(
+            [(today, tomorrow), (tomorrow, day_after_tomorrow)]
+        )
 
-        for price in (prices_today.electricity + prices_tomorrow.electricity).all:
+        for price in prices_today.electricity.chain(prices_tomorrow.electricity):
             print(f"Electricity: {price.date_from} -> {price.date_till}: {price.total}")
 
-        for price in (prices_today.gas + prices_tomorrow.gas).all:
+        for price in prices_today.gas.chain(prices_tomorrow.gas):
             print(f"Gas: {price.date_from} -> {price.date_till}: {price.total}")
 
-    async with FrankEnergie(country=FrankCountry.Belgium) as fe:
+    async with FrankEnergie(session, country=FrankCountry.Belgium) as fe:
         authToken = await fe.login("pieter@vanoost.cloud", "YZthfV.q9g4B")
 
-        user = await fe.user()
-
-        user_prices_today = await fe.user_prices(today)
-        user_prices_tomorrow = await fe.user_prices(tomorrow)
-
-        for price in (
-            user_prices_today.electricity + user_prices_tomorrow.electricity
-        ).all:
+        # login() already loaded the site reference, so the requests below
+        # are independent and can run concurrently.
+        (
+            user,
+            user_prices_today,
+            user_prices_tomorrow,
+            month_summary,
+            invoices,
+        ) = await asyncio.gather(
+            fe.user(),
+            fe.user_prices(today),
+            fe.user_prices(tomorrow),
+            fe.month_summary(),
+            fe.invoices(),
+        )
+
+        for price in user_prices_today.electricity.chain(
+            user_prices_tomorrow.electricity
+        ):
             print(f"Electricity: {price.date_from} -> {price.date_till}: {price.total}")
 
-        for price in (user_prices_today.gas + user_prices_tomorrow.gas).all:
+        for price in user_prices_today.gas.chain(user_prices_tomorrow.gas):
             print(f"Gas: {price.date_from} -> {price.date_till}: {price.total}")
 
-        print(await fe.month_summary())
-        print(await fe.invoices())
+        print(month_summary)
+        print(invoices)
 
     # async with FrankEnergie(auth_token=authToken.authToken) as fe:
     #     print(await fe.month_summary())
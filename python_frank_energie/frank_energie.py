@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import time
 from datetime import date
+from functools import lru_cache
 from typing import Any
 
-from aiohttp.client import ClientError, ClientSession
+import orjson
+from aiohttp.client import ClientConnectorError, ClientError, ClientSession
+from aiohttp.connector import TCPConnector
 
 from .exceptions import AuthException, AuthRequiredException
 from .models import (
@@ -14,54 +19,355 @@ from .models import (
     Invoices,
     MarketPrices,
     MonthSummary,
+    PriceData,
     User,
     FrankCountry,
 )
 
 
+_LOGIN_QUERY = {
+    "query": """
+        mutation Login($email: String!, $password: String!) {
+            login(email: $email, password: $password) {
+                authToken
+                refreshToken
+            }
+        }
+    """,
+    "operationName": "Login",
+}
+
+_RENEW_TOKEN_QUERY = {
+    "query": """
+        mutation RenewToken($authToken: String!, $refreshToken: String!) {
+            renewToken(authToken: $authToken, refreshToken: $refreshToken) {
+                authToken
+                refreshToken
+            }
+        }
+    """,
+    "operationName": "RenewToken",
+}
+
+_MONTH_SUMMARY_QUERIES = {
+    FrankCountry.Netherlands: {
+        "query": """
+        query MonthSummary {
+            monthSummary {
+                actualCostsUntilLastMeterReadingDate
+                expectedCostsUntilLastMeterReadingDate
+                expectedCosts
+                lastMeterReadingDate
+            }
+        }
+    """,
+        "operationName": "MonthSummary",
+    },
+    FrankCountry.Belgium: {
+        "query": "query MonthSummary($siteReference: String!) {\n  monthSummary(siteReference: $siteReference) {\n    _id\n    lastMeterReadingDate\n    expectedCostsUntilLastMeterReadingDate\n    actualCostsUntilLastMeterReadingDate\n    meterReadingDayCompleteness\n    gasExcluded\n  }\n}\n",
+        "operationName": "MonthSummary",
+    },
+}
+
+_INVOICES_QUERIES = {
+    FrankCountry.Netherlands: {
+        "query": """
+        query Invoices {
+            invoices {
+                previousPeriodInvoice {
+                    StartDate
+                    PeriodDescription
+                    TotalAmount
+                }
+                currentPeriodInvoice {
+                    StartDate
+                    PeriodDescription
+                    TotalAmount
+                }
+                upcomingPeriodInvoice {
+                    StartDate
+                    PeriodDescription
+                    TotalAmount
+                }
+            }
+        }
+    """,
+        "operationName": "Invoices",
+    },
+    FrankCountry.Belgium: {
+        "query": "query Invoices($siteReference: String!) {\n  invoices(siteReference: $siteReference) {\n    _id\n    previousPeriodInvoice {\n      id\n      StartDate\n      PeriodDescription\n      TotalAmount\n      __typename\n    }\n    currentPeriodInvoice {\n      id\n      StartDate\n      PeriodDescription\n      TotalAmount\n      __typename\n    }\n    upcomingPeriodInvoice {\n      id\n      StartDate\n      PeriodDescription\n      TotalAmount\n      __typename\n    }\n    allInvoices {\n      id\n      StartDate\n      PeriodDescription\n      TotalAmount\n      __typename\n    }\n    __typename\n  }\n}",
+        "operationName": "Invoices",
+    },
+}
+
+_USER_QUERIES = {
+    FrankCountry.Netherlands: {
+        "query": """
+        query Me {
+            me {
+                ...UserFields
+            }
+        }
+        fragment UserFields on User {
+            id
+            connectionsStatus
+            firstMeterReadingDate
+            lastMeterReadingDate
+            advancedPaymentAmount
+            treesCount
+            hasCO2Compensation
+        }
+    """,
+        "operationName": "Me",
+    },
+    FrankCountry.Belgium: {
+        "query": "query Me($siteReference: String) {\n  me {\n    ...UserFields\n  }\n}\n\nfragment UserFields on User {\n  id\n  email\n  countryCode\n  advancedPaymentAmount(siteReference: $siteReference)\n  treesCount\n  hasInviteLink\n  hasCO2Compensation\n  notification\n  createdAt\n  deliverySites {\n    reference }\n}\n",
+        "operationName": "Me",
+    },
+}
+
+_PRICES_QUERIES = {
+    FrankCountry.Netherlands: {
+        "query": """
+            query MarketPrices($startDate: Date!, $endDate: Date!) {
+                marketPricesElectricity(startDate: $startDate, endDate: $endDate) {
+                from
+                till
+                marketPrice
+                marketPriceTax
+                sourcingMarkupPrice
+                energyTaxPrice
+                }
+                marketPricesGas(startDate: $startDate, endDate: $endDate) {
+                from
+                till
+                marketPrice
+                marketPriceTax
+                sourcingMarkupPrice
+                energyTaxPrice
+                }
+            }
+        """,
+        "operationName": "MarketPrices",
+    },
+    FrankCountry.Belgium: {
+        "query": "query MarketPrices($date: String!) {\n  marketPrices(date: $date) {\n    electricityPrices {\n      from\n      till\n      marketPrice\n      marketPriceTax\n      sourcingMarkupPrice\n      energyTaxPrice\n      perUnit\n    }\n    gasPrices {\n      from\n      till\n      marketPrice\n      marketPriceTax\n      sourcingMarkupPrice\n      energyTaxPrice\n      perUnit\n    }\n  }\n}\n",
+        "operationName": "MarketPrices",
+    },
+}
+
+_USER_PRICES_QUERIES = {
+    FrankCountry.Netherlands: {
+        "query": """
+        query CustomerMarketPrices($date: String!) {
+            customerMarketPrices(date: $date) {
+                electricityPrices {
+                    from
+                    till
+                    marketPrice
+                    marketPriceTax
+                    sourcingMarkupPrice: consumptionSourcingMarkupPrice
+                    energyTaxPrice: energyTax
+                }
+                gasPrices {
+                    from
+                    till
+                    marketPrice
+                    marketPriceTax
+                    sourcingMarkupPrice: consumptionSourcingMarkupPrice
+                    energyTaxPrice: energyTax
+                }
+            }
+        }
+    """,
+        "operationName": "CustomerMarketPrices",
+    },
+    FrankCountry.Belgium: {
+        "query": "query MarketPrices($date: String!, $siteReference: String!) {\n  customerMarketPrices(date: $date, siteReference: $siteReference) {\n    id\n    electricityPrices {\n      id\n      from\n      till\n      date\n      marketPrice\n      marketPriceTax\n      consumptionSourcingMarkupPrice\n      energyTax\n      perUnit\n    }\n    gasPrices {\n      id\n      from\n      till\n      date\n      marketPrice\n      marketPriceTax\n      consumptionSourcingMarkupPrice\n      energyTax\n      perUnit\n    }\n  }\n}\n",
+        "operationName": "MarketPrices",
+    },
+}
+
+
+_PRICE_FIELDS = """{
+    from
+    till
+    marketPrice
+    marketPriceTax
+    sourcingMarkupPrice
+    energyTaxPrice
+}"""
+
+
+@lru_cache(maxsize=16)
+def _prices_batch_query(country: FrankCountry, count: int) -> str:
+    """Build the aliased MarketPricesBatch query for count date ranges."""
+    definitions = []
+    selections = []
+
+    for index in range(count):
+        if country == FrankCountry.Belgium:
+            definitions.append(f"$date{index}: String!")
+            selections.append(
+                f"d{index}: marketPrices(date: $date{index}) {{\n"
+                f"    electricityPrices {_PRICE_FIELDS}\n"
+                f"    gasPrices {_PRICE_FIELDS}\n"
+                "}"
+            )
+        else:
+            definitions.append(f"$startDate{index}: Date!, $endDate{index}: Date!")
+            arguments = f"(startDate: $startDate{index}, endDate: $endDate{index})"
+            selections.append(
+                f"d{index}_electricity: marketPricesElectricity{arguments} {_PRICE_FIELDS}\n"
+                f"d{index}_gas: marketPricesGas{arguments} {_PRICE_FIELDS}"
+            )
+
+    return (
+        f"query MarketPricesBatch({', '.join(definitions)}) {{\n"
+        + "\n".join(selections)
+        + "\n}"
+    )
+
+
+class _TokenBucket:
+    """Token bucket limiting the number of requests per second."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate,
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) / self.rate
+
+            # Sleep without holding the lock, so other waiters can refill too
+            await asyncio.sleep(wait_time)
+
+
 class FrankEnergie:
     """FrankEnergie API."""
 
     DATA_URL = "https://frank-graphql-prod.graphcdn.app/"
 
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 8.0
+
     def __init__(
         self,
         clientsession: ClientSession = None,
         auth_token: str | None = None,
         refresh_token: str | None = None,
         country: FrankCountry | None = FrankCountry.Netherlands,
+        cache_ttl: float = 900,
+        rate_limit: float | None = 10,
     ):
-        """Initialize the FrankEnergie client."""
+        """Initialize the FrankEnergie client.
+
+        Responses of prices, user_prices, user, month_summary and invoices are
+        cached for cache_ttl seconds, set it to 0 to disable caching.
+
+        Requests are limited to rate_limit per second, set it to None to
+        disable the limit.
+        """
         self._country = country
         self._close_session: bool = False
         self._auth: Authentication | None = None
         self._session = clientsession
         self._siteReference = None
+        self._site_reference_lock = asyncio.Lock()
+        self._user_request: asyncio.Future[User] | None = None
+        self._cache_ttl = cache_ttl
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        self._limiter = (
+            _TokenBucket(rate_limit, max(1, rate_limit)) if rate_limit else None
+        )
 
         if auth_token is not None or refresh_token is not None:
             self._auth = Authentication(auth_token, refresh_token)
 
-    async def _query(self, query):
+        self._rebuild_headers()
+
+    def _rebuild_headers(self) -> None:
+        """Build the request headers, call whenever _auth changes."""
+        self._headers = {
+            "Content-Type": "application/json",
+            "X-Country": self._country.value,
+        }
+        if self._auth is not None:
+            self._headers["Authorization"] = f"Bearer {self._auth.authToken}"
+
+    async def _query(self, query, idempotent: bool = True):
+        """Post a query and return the decoded response.
+
+        Mutations should pass idempotent=False: they are only retried when the
+        connection failed, so a request the server may have handled is never
+        sent twice.
+        """
         if self._session is None:
-            self._session = ClientSession()
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=20, keepalive_timeout=300, ttl_dns_cache=300
+                )
+            )
             self._close_session = True
 
-        try:
-            resp = await self._session.post(
-                self.DATA_URL,
-                json=query,
-                headers={
-                    "Authorization": f"Bearer {self._auth.authToken}",
-                    "X-Country": self._country.value,
-                }
-                if self._auth is not None
-                else {"X-Country": self._country.value},
-            )
+        data = orjson.dumps(query)
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            if self._limiter is not None:
+                await self._limiter.acquire()
+
+            retry_after = None
+            try:
+                async with self._session.post(
+                    self.DATA_URL, data=data, headers=self._headers
+                ) as resp:
+                    # Rate limited or server error, worth another try
+                    if resp.status == 429 or resp.status >= 500:
+                        retry_after = resp.headers.get("Retry-After")
+                        resp.raise_for_status()
+
+                    body = await resp.read()
+                break
+
+            except (asyncio.TimeoutError, ClientError) as error:
+                delay = (
+                    None
+                    if attempt == self.MAX_RETRIES
+                    or not (idempotent or isinstance(error, ClientConnectorError))
+                    else self._retry_delay(attempt, retry_after)
+                )
+                # Out of retries or asked to wait too long, let the caller see
+                # what went wrong; a ClientResponseError carries the status.
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
 
-            response = await resp.json()
+        try:
+            response = orjson.loads(body)
+        except orjson.JSONDecodeError as error:
+            raise ValueError(f"Unexpected response: {error}") from error
 
-        except (asyncio.TimeoutError, ClientError, KeyError) as error:
-            raise ValueError(f"Request failed: {error}") from error
+        if not isinstance(response, dict):
+            raise ValueError(f"Unexpected response: {response!r}")
 
         # Catch common error messages and raise a more specific exception
         if errors := response.get("errors"):
@@ -71,22 +377,89 @@ class FrankEnergie:
 
         return response
 
+    def _retry_delay(self, attempt: int, retry_after: str | None) -> float | None:
+        """Seconds to wait before the next attempt.
+
+        Honours a Retry-After header in seconds, otherwise uses exponential
+        backoff with jitter. Returns None when the server asks to wait longer
+        than RETRY_MAX_DELAY, the request should not be retried then.
+        """
+        if retry_after is not None:
+            try:
+                delay = max(0.0, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date, fall back to backoff
+            else:
+                return delay if delay <= self.RETRY_MAX_DELAY else None
+
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2**attempt)
+        return delay * random.uniform(0.5, 1.5)  # noqa: S311
+
+    def _cache_key(self, query: dict[str, Any]) -> tuple:
+        return (
+            query["operationName"],
+            self._country,
+            tuple(sorted(query["variables"].items())),
+        )
+
+    def _cache_get(self, key: tuple) -> Any | None:
+        if (entry := self._cache.get(key)) is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self._cache_ttl:
+            del self._cache[key]
+            return None
+
+        return value
+
+    def _cache_set(self, key: tuple, value: Any) -> None:
+        if self._cache_ttl <= 0:
+            return
+
+        now = time.monotonic()
+        # Keys change with every date, drop expired entries so the cache of a
+        # long running poller doesn't keep growing.
+        for expired in [
+            k
+            for k, (stored_at, _) in self._cache.items()
+            if now - stored_at >= self._cache_ttl
+        ]:
+            del self._cache[expired]
+
+        self._cache[key] = (now, value)
+
+    def _prices_cache_get(self, key: tuple) -> MarketPrices | None:
+        if (cached := self._cache_get(key)) is None:
+            return None
+
+        # Every hit gets its own price lists, callers are free to modify them
+        electricity, gas = cached
+        return MarketPrices(
+            electricity=PriceData.__new__(PriceData)._init_from_list(list(electricity)),
+            gas=PriceData.__new__(PriceData)._init_from_list(list(gas)),
+        )
+
+    def _prices_cache_set(self, key: tuple, prices: MarketPrices) -> None:
+        # Don't cache missing prices, they may be published any moment
+        if prices.electricity.price_data or prices.gas.price_data:
+            self._cache_set(
+                key,
+                (tuple(prices.electricity.price_data), tuple(prices.gas.price_data)),
+            )
+
     async def login(self, username: str, password: str) -> Authentication:
         """Login and get the authentication token."""
         query = {
-            "query": """
-                mutation Login($email: String!, $password: String!) {
-                    login(email: $email, password: $password) {
-                        authToken
-                        refreshToken
-                    }
-                }
-            """,
-            "operationName": "Login",
+            **_LOGIN_QUERY,
             "variables": {"email": username, "password": password},
         }
 
-        self._auth = Authentication.from_dict(await self._query(query))
+        self._auth = Authentication.from_dict(
+            await self._query(query, idempotent=False)
+        )
+        self._rebuild_headers()
+        self._cache.clear()
 
         await self._load_site_reference()
 
@@ -98,22 +471,18 @@ class FrankEnergie:
             raise AuthRequiredException
 
         query = {
-            "query": """
-                mutation RenewToken($authToken: String!, $refreshToken: String!) {
-                    renewToken(authToken: $authToken, refreshToken: $refreshToken) {
-                        authToken
-                        refreshToken
-                    }
-                }
-            """,
-            "operationName": "RenewToken",
+            **_RENEW_TOKEN_QUERY,
             "variables": {
                 "authToken": self._auth.authToken,
                 "refreshToken": self._auth.refreshToken,
             },
         }
 
-        self._auth = Authentication.from_dict(await self._query(query))
+        self._auth = Authentication.from_dict(
+            await self._query(query, idempotent=False)
+        )
+        self._rebuild_headers()
+        self._cache.clear()
 
         await self._load_site_reference()
 
@@ -123,12 +492,15 @@ class FrankEnergie:
         if self._auth is None:
             raise AuthRequiredException
 
-        if self._country == FrankCountry.Belgium and self._siteReference is None:
-            me = await self.user()
-            self._siteReference = me.siteReference
-        else:
+        if self._country != FrankCountry.Belgium or self._siteReference is not None:
             return
 
+        # Concurrent callers wait for the first lookup instead of repeating it
+        async with self._site_reference_lock:
+            if self._siteReference is None:
+                me = await self.user()
+                self._siteReference = me.siteReference
+
     async def month_summary(self) -> MonthSummary:
         """Get month summary data."""
         if self._auth is None:
@@ -136,31 +508,21 @@ class FrankEnergie:
 
         await self._load_site_reference()
 
-        queries = {
-            FrankCountry.Netherlands: {
-                "query": """
-                query MonthSummary {
-                    monthSummary {
-                        actualCostsUntilLastMeterReadingDate
-                        expectedCostsUntilLastMeterReadingDate
-                        expectedCosts
-                        lastMeterReadingDate
-                    }
-                }
-            """,
-                "operationName": "MonthSummary",
-                "variables": {},
-            },
-            FrankCountry.Belgium: {
-                "query": "query MonthSummary($siteReference: String!) {\n  monthSummary(siteReference: $siteReference) {\n    _id\n    lastMeterReadingDate\n    expectedCostsUntilLastMeterReadingDate\n    actualCostsUntilLastMeterReadingDate\n    meterReadingDayCompleteness\n    gasExcluded\n  }\n}\n",
-                "variables": {"siteReference": self._siteReference},
-                "operationName": "MonthSummary",
-            },
+        query_data = {
+            **_MONTH_SUMMARY_QUERIES[self._country],
+            "variables": {"siteReference": self._siteReference}
+            if self._country == FrankCountry.Belgium
+            else {},
         }
 
-        query_data = queries[self._country]
+        cache_key = self._cache_key(query_data)
+        if (cached := self._cache_get(cache_key)) is not None:
+            return cached
 
-        return MonthSummary.from_dict(await self._query(query_data))
+        summary = MonthSummary.from_dict(await self._query(query_data))
+        self._cache_set(cache_key, summary)
+
+        return summary
 
     async def invoices(self) -> Invoices:
         """Get invoices data.
@@ -172,120 +534,163 @@ class FrankEnergie:
 
         await self._load_site_reference()
 
-        queries = {
-            FrankCountry.Netherlands: {
-                "query": """
-                query Invoices {
-                    invoices {
-                        previousPeriodInvoice {
-                            StartDate
-                            PeriodDescription
-                            TotalAmount
-                        }
-                        currentPeriodInvoice {
-                            StartDate
-                            PeriodDescription
-                            TotalAmount
-                        }
-                        upcomingPeriodInvoice {
-                            StartDate
-                            PeriodDescription
-                            TotalAmount
-                        }
-                    }
-                }
-            """,
-                "operationName": "Invoices",
-                "variables": {},
-            },
-            FrankCountry.Belgium: {
-                "query": "query Invoices($siteReference: String!) {\n  invoices(siteReference: $siteReference) {\n    _id\n    previousPeriodInvoice {\n      id\n      StartDate\n      PeriodDescription\n      TotalAmount\n      __typename\n    }\n    currentPeriodInvoice {\n      id\n      StartDate\n      PeriodDescription\n      TotalAmount\n      __typename\n    }\n    upcomingPeriodInvoice {\n      id\n      StartDate\n      PeriodDescription\n      TotalAmount\n      __typename\n    }\n    allInvoices {\n      id\n      StartDate\n      PeriodDescription\n      TotalAmount\n      __typename\n    }\n    __typename\n  }\n}",
-                "variables": {"siteReference": self._siteReference},
-                "operationName": "Invoices",
-            },
+        query_data = {
+            **_INVOICES_QUERIES[self._country],
+            "variables": {"siteReference": self._siteReference}
+            if self._country == FrankCountry.Belgium
+            else {},
         }
 
-        query_data = queries[self._country]
+        cache_key = self._cache_key(query_data)
+        if (cached := self._cache_get(cache_key)) is not None:
+            return cached
+
+        invoices = Invoices.from_dict(await self._query(query_data))
+        self._cache_set(cache_key, invoices)
 
-        return Invoices.from_dict(await self._query(query_data))
+        return invoices
 
     async def user(self) -> User:
         """Get user data."""
         if self._auth is None:
             raise AuthRequiredException
 
-        queries = {
-            FrankCountry.Netherlands: {
-                "query": """
-                query Me {
-                    me {
-                        ...UserFields
-                    }
-                }
-                fragment UserFields on User {
-                    id
-                    connectionsStatus
-                    firstMeterReadingDate
-                    lastMeterReadingDate
-                    advancedPaymentAmount
-                    treesCount
-                    hasCO2Compensation
-                }
-            """,
-                "operationName": "Me",
-                "variables": {},
-            },
-            FrankCountry.Belgium: {
-                "query": "query Me($siteReference: String) {\n  me {\n    ...UserFields\n  }\n}\n\nfragment UserFields on User {\n  id\n  email\n  countryCode\n  advancedPaymentAmount(siteReference: $siteReference)\n  treesCount\n  hasInviteLink\n  hasCO2Compensation\n  notification\n  createdAt\n  deliverySites {\n    reference }\n}\n",
-                "variables": {"siteReference": None},
-                "operationName": "Me",
-            },
+        query = {
+            **_USER_QUERIES[self._country],
+            "variables": {"siteReference": None}
+            if self._country == FrankCountry.Belgium
+            else {},
         }
 
-        query = queries[self._country]
+        cache_key = self._cache_key(query)
+        if (cached := self._cache_get(cache_key)) is not None:
+            return cached
+
+        # Concurrent callers share the request in flight instead of sending their own
+        if self._user_request is None:
+            self._user_request = asyncio.ensure_future(
+                self._fetch_user(query, cache_key)
+            )
+            self._user_request.add_done_callback(self._user_request_done)
+
+        return await asyncio.shield(self._user_request)
 
-        return User.from_dict(await self._query(query))
+    async def _fetch_user(self, query: dict[str, Any], cache_key: tuple) -> User:
+        user = User.from_dict(await self._query(query))
+        self._cache_set(cache_key, user)
+        return user
+
+    def _user_request_done(self, request: asyncio.Future[User]) -> None:
+        if self._user_request is request:
+            self._user_request = None
+
+    def _prices_query(self, start_date: date, end_date: date | None) -> dict[str, Any]:
+        return {
+            **_PRICES_QUERIES[self._country],
+            "variables": {"date": str(start_date)}
+            if self._country == FrankCountry.Belgium
+            else {"startDate": str(start_date), "endDate": str(end_date)},
+        }
 
     async def prices(
         self, start_date: date, end_date: date | None = None
     ) -> MarketPrices:
         """Get market prices."""
 
-        queries = {
-            FrankCountry.Netherlands: {
-                "query": """
-                    query MarketPrices($startDate: Date!, $endDate: Date!) {
-                        marketPricesElectricity(startDate: $startDate, endDate: $endDate) {
-                        from
-                        till
-                        marketPrice
-                        marketPriceTax
-                        sourcingMarkupPrice
-                        energyTaxPrice
-                        }
-                        marketPricesGas(startDate: $startDate, endDate: $endDate) {
-                        from
-                        till
-                        marketPrice
-                        marketPriceTax
-                        sourcingMarkupPrice
-                        energyTaxPrice
-                        }
-                    }
-                """,
-                "variables": {"startDate": str(start_date), "endDate": str(end_date)},
-                "operationName": "MarketPrices",
-            },
-            FrankCountry.Belgium: {
-                "query": "query MarketPrices($date: String!) {\n  marketPrices(date: $date) {\n    electricityPrices {\n      from\n      till\n      marketPrice\n      marketPriceTax\n      sourcingMarkupPrice\n      energyTaxPrice\n      perUnit\n    }\n    gasPrices {\n      from\n      till\n      marketPrice\n      marketPriceTax\n      sourcingMarkupPrice\n      energyTaxPrice\n      perUnit\n    }\n  }\n}\n",
-                "variables": {"date": str(start_date)},
-                "operationName": "MarketPrices",
-            },
+        query_data = self._prices_query(start_date, end_date)
+
+        cache_key = self._cache_key(query_data)
+        if (cached := self._prices_cache_get(cache_key)) is not None:
+            return cached
+
+        prices = MarketPrices.from_dict(await self._query(query_data))
+        self._prices_cache_set(cache_key, prices)
+
+        return prices
+
+    async def prices_batch(
+        self, date_ranges: list[tuple[date, date | None]]
+    ) -> list[MarketPrices]:
+        """Get market prices for multiple date ranges in a single request.
+
+        Every range is added to one GraphQL document under its own alias,
+        so fetching today and tomorrow only costs one round-trip. Ranges
+        cached by an earlier prices or prices_batch call are not requested.
+        """
+        cache_keys = [
+            self._cache_key(self._prices_query(start_date, end_date))
+            for start_date, end_date in date_ranges
+        ]
+        results: list[MarketPrices | None] = [
+            self._prices_cache_get(cache_key) for cache_key in cache_keys
+        ]
+        missing = [index for index, prices in enumerate(results) if prices is None]
+        if not missing:
+            return results
+
+        variables = {}
+        for alias_index, index in enumerate(missing):
+            start_date, end_date = date_ranges[index]
+            if self._country == FrankCountry.Belgium:
+                variables[f"date{alias_index}"] = str(start_date)
+            else:
+                variables[f"startDate{alias_index}"] = str(start_date)
+                variables[f"endDate{alias_index}"] = str(end_date)
+
+        query_data = {
+            "query": _prices_batch_query(self._country, len(missing)),
+            "variables": variables,
+            "operationName": "MarketPricesBatch",
         }
 
-        query_data = queries[self._country]
+        response = await self._query(query_data)
+        data = response.get("data") or {}
+        errors = response.get("errors") or []
+
+        for alias_index, index in enumerate(missing):
+            alias = f"d{alias_index}"
+            # Only pass on errors that belong to this alias (or to the whole request)
+            alias_errors = [
+                error
+                for error in errors
+                if not error.get("path") or str(error["path"][0]).split("_")[0] == alias
+            ]
+
+            if self._country == FrankCountry.Belgium:
+                payload = {"marketPrices": data.get(alias)} if data.get(alias) else None
+            elif data.get(f"{alias}_electricity") is not None:
+                payload = {
+                    "marketPricesElectricity": data.get(f"{alias}_electricity"),
+                    "marketPricesGas": data.get(f"{alias}_gas"),
+                }
+            else:
+                payload = None
+
+            prices = MarketPrices.from_dict(
+                {"data": payload, "errors": alias_errors}
+                if alias_errors
+                else {"data": payload}
+            )
+            self._prices_cache_set(cache_keys[index], prices)
+            results[index] = prices
 
-        return MarketPrices.from_dict(await self._query(query_data))
+        return results
+
+    async def prices_many(
+        self, date_ranges: list[tuple[date, date | None]]
+    ) -> list[MarketPrices]:
+        """Get market prices for multiple date ranges using concurrent requests.
+
+        Fallback for servers that don't handle the aliased query of `prices_batch`.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.prices(start_date, end_date)
+                    for start_date, end_date in date_ranges
+                )
+            )
+        )
 
     async def user_prices(self, start_date: date) -> MarketPrices:
         """Get customer market prices."""
@@ -294,46 +699,21 @@ class FrankEnergie:
 
         await self._load_site_reference()
 
-        queries = {
-            FrankCountry.Netherlands: {
-                "query": """
-                query CustomerMarketPrices($date: String!) {
-                    customerMarketPrices(date: $date) {
-                        electricityPrices {
-                            from
-                            till
-                            marketPrice
-                            marketPriceTax
-                            sourcingMarkupPrice: consumptionSourcingMarkupPrice
-                            energyTaxPrice: energyTax
-                        }
-                        gasPrices {
-                            from
-                            till
-                            marketPrice
-                            marketPriceTax
-                            sourcingMarkupPrice: consumptionSourcingMarkupPrice
-                            energyTaxPrice: energyTax
-                        }
-                    }
-                }
-            """,
-                "variables": {"date": str(start_date)},
-                "operationName": "CustomerMarketPrices",
-            },
-            FrankCountry.Belgium: {
-                "query": "query MarketPrices($date: String!, $siteReference: String!) {\n  customerMarketPrices(date: $date, siteReference: $siteReference) {\n    id\n    electricityPrices {\n      id\n      from\n      till\n      date\n      marketPrice\n      marketPriceTax\n      consumptionSourcingMarkupPrice\n      energyTax\n      perUnit\n    }\n    gasPrices {\n      id\n      from\n      till\n      date\n      marketPrice\n      marketPriceTax\n      consumptionSourcingMarkupPrice\n      energyTax\n      perUnit\n    }\n  }\n}\n",
-                "variables": {
-                    "siteReference": self._siteReference,
-                    "date": str(start_date),
-                },
-                "operationName": "MarketPrices",
-            },
+        query_data = {
+            **_USER_PRICES_QUERIES[self._country],
+            "variables": {"siteReference": self._siteReference, "date": str(start_date)}
+            if self._country == FrankCountry.Belgium
+            else {"date": str(start_date)},
         }
 
-        query_data = queries[self._country]
+        cache_key = self._cache_key(query_data)
+        if (cached := self._prices_cache_get(cache_key)) is not None:
+            return cached
+
+        prices = MarketPrices.from_userprices_dict(await self._query(query_data))
+        self._prices_cache_set(cache_key, prices)
 
-        return MarketPrices.from_userprices_dict(await self._query(query_data))
+        return prices
 
     @property
     def is_authenticated(self) -> bool:
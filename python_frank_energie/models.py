@@ -2,24 +2,66 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import sys
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter, itemgetter
 
 import jwt
-from dateutil import parser
 
 from .exceptions import AuthException, RequestException
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keys of the sourcing markup and energy tax prices in a price row
+_PRICE_FIELD_NAMES = ("sourcingMarkupPrice", "energyTaxPrice")
+_CUSTOMER_PRICE_FIELD_NAMES = ("consumptionSourcingMarkupPrice", "energyTax")
+
+# Fields requested by every query variant, fetched in a single call
+_AUTHENTICATION_FIELDS = itemgetter("authToken", "refreshToken")
+_INVOICE_FIELDS = itemgetter("StartDate", "PeriodDescription", "TotalAmount")
+_INVOICES_FIELDS = itemgetter(
+    "previousPeriodInvoice", "currentPeriodInvoice", "upcomingPeriodInvoice"
+)
+
+
+def _price_field_names(data: dict) -> tuple[str, str]:
+    """Keys of the sourcing markup and energy tax prices in a price row.
+
+    Customer prices for Belgium are not aliased and use the raw field names.
+    """
+    return (
+        _PRICE_FIELD_NAMES
+        if _PRICE_FIELD_NAMES[0] in data
+        else _CUSTOMER_PRICE_FIELD_NAMES
+    )
+
+
+if sys.version_info >= (3, 11):
+    # Accepts the trailing 'Z' of the API timestamps, no need to rewrite them
+    _parse_datetime = datetime.fromisoformat
+else:
+
+    def _parse_datetime(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp as returned by the API.
+
+        datetime.fromisoformat only accepts a trailing 'Z' from Python 3.11.
+        """
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
 from enum import Enum
 
 class FrankCountry(Enum):
     Netherlands = 'NL'
     Belgium = 'BE'
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Authentication:
     """Authentication data.
 
@@ -45,12 +87,14 @@ class Authentication:
         if not login_payload and not renew_payload:
             raise AuthException("Unexpected response")
 
-        payload = login_payload or renew_payload
+        try:
+            authToken, refreshToken = _AUTHENTICATION_FIELDS(
+                login_payload or renew_payload
+            )
+        except KeyError as error:
+            raise AuthException("Unexpected response") from error
 
-        return Authentication(
-            authToken=payload.get("authToken"),
-            refreshToken=payload.get("refreshToken"),
-        )
+        return Authentication(authToken=authToken, refreshToken=refreshToken)
 
     def authTokenValid(self, tz: timezone = timezone.utc) -> bool:
         """Return that authToken is valid according to expiration time."""
@@ -65,11 +109,11 @@ class Authentication:
         ) > datetime.now(tz=tz)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Invoices:
     """Invoices data, including the previous, current and upcoming period."""
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class Invoice:
         """Invoice data, including the start date, period description and total amount."""
 
@@ -83,10 +127,15 @@ class Invoices:
             if data is None:
                 return None
 
+            try:
+                start_date, period_description, total_amount = _INVOICE_FIELDS(data)
+            except KeyError as error:
+                raise RequestException("Unexpected response") from error
+
             return Invoices.Invoice(
-                StartDate=parser.parse(data.get("StartDate")),
-                PeriodDescription=data.get("PeriodDescription"),
-                TotalAmount=data.get("TotalAmount"),
+                StartDate=_parse_datetime(start_date),
+                PeriodDescription=period_description,
+                TotalAmount=total_amount,
             )
 
     previousPeriodInvoice: Invoice | None
@@ -105,20 +154,21 @@ class Invoices:
         if not payload:
             raise RequestException("Unexpected response")
 
+        try:
+            previous_invoice, current_invoice, upcoming_invoice = _INVOICES_FIELDS(
+                payload
+            )
+        except KeyError as error:
+            raise RequestException("Unexpected response") from error
+
         return Invoices(
-            previousPeriodInvoice=Invoices.Invoice.from_dict(
-                payload.get("previousPeriodInvoice")
-            ),
-            currentPeriodInvoice=Invoices.Invoice.from_dict(
-                payload.get("currentPeriodInvoice")
-            ),
-            upcomingPeriodInvoice=Invoices.Invoice.from_dict(
-                payload.get("upcomingPeriodInvoice")
-            ),
+            previousPeriodInvoice=Invoices.Invoice.from_dict(previous_invoice),
+            currentPeriodInvoice=Invoices.Invoice.from_dict(current_invoice),
+            upcomingPeriodInvoice=Invoices.Invoice.from_dict(upcoming_invoice),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     """User data, including the current status of the connection."""
 
@@ -153,7 +203,7 @@ class User:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonthSummary:
     """Month summary data, including the actual and expected costs for this month."""
 
@@ -198,6 +248,17 @@ class MonthSummary:
 class Price:
     """Price data for one hour."""
 
+    __slots__ = (
+        "date_from",
+        "date_till",
+        "market_price",
+        "market_price_tax",
+        "sourcing_markup_price",
+        "energy_tax_price",
+        "_market_price_with_tax",
+        "_total",
+    )
+
     date_from: datetime
     date_till: datetime
     market_price: float
@@ -205,15 +266,33 @@ class Price:
     sourcing_markup_price: float
     energy_tax_price: float
 
-    def __init__(self, data: dict) -> None:
-        """Parse the response from the prices query."""
-        self.date_from = parser.parse(data["from"])
-        self.date_till = parser.parse(data["till"])
+    def __init__(self, data: dict, field_names: tuple[str, str] | None = None) -> None:
+        """Parse the response from the prices query.
+
+        field_names are the keys of the sourcing markup and energy tax prices,
+        they are looked up in data when not given.
+        """
+        if field_names is None:
+            field_names = _price_field_names(data)
+
+        self.date_from = _parse_datetime(data["from"])
+        self.date_till = _parse_datetime(data["till"])
 
         self.market_price = data["marketPrice"]
         self.market_price_tax = data["marketPriceTax"]
-        self.sourcing_markup_price = data["sourcingMarkupPrice"] if "sourcingMarkupPrice" in data else data["consumptionSourcingMarkupPrice"]
-        self.energy_tax_price = data["energyTaxPrice"] if "energyTaxPrice" in data else data["energyTax"]
+        self.sourcing_markup_price = data[field_names[0]]
+        self.energy_tax_price = data[field_names[1]]
+
+        self._market_price_with_tax = round(
+            self.market_price + self.market_price_tax, 4
+        )
+        self._total = round(
+            self.market_price
+            + self.market_price_tax
+            + self.sourcing_markup_price
+            + self.energy_tax_price,
+            4,
+        )
 
     def __str__(self) -> str:
         """Return a string representation of this price entry."""
@@ -222,54 +301,79 @@ class Price:
     @property
     def for_now(self) -> bool:
         """Whether this price entry is for the current hour."""
-        return self.date_from <= datetime.now(timezone.utc) < self.date_till
+        return self._for_now(datetime.now(timezone.utc))
 
     @property
     def for_future(self) -> bool:
         """Whether this price entry is for and hour after the current one."""
-        return self.date_from.hour > datetime.now(timezone.utc).hour
+        return self._for_future(datetime.now(timezone.utc))
 
     @property
     def for_today(self) -> bool:
         """Whether this price entry is for the current day."""
-        day_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
+        return self._for_today(datetime.now(timezone.utc))
+
+    def _for_now(self, now: datetime) -> bool:
+        return self.date_from <= now < self.date_till
+
+    def _for_future(self, now: datetime) -> bool:
+        return self.date_from.hour > now.hour
+
+    def _for_today(self, now: datetime) -> bool:
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + timedelta(days=1)
         return self.date_from >= day_start and self.date_till <= day_end
 
     @property
     def market_price_with_tax(self) -> float:
         """The market price including tax."""
-        return round(self.market_price + self.market_price_tax, 4)
+        return self._market_price_with_tax
 
     @property
     def total(self) -> float:
         """The total price for this hour."""
-        return round(
-            self.market_price
-            + self.market_price_tax
-            + self.sourcing_markup_price
-            + self.energy_tax_price,
-            4,
-        )
+        return self._total
+
+
+_TOTAL = attrgetter("total")
 
 
 class PriceData:
     """Price data for a period of time."""
 
-    price_data: list[Price] = []
+    __slots__ = ("price_data",)
+
+    price_data: list[Price]
 
-    def __init__(self, price_data: list[dict] | None = None) -> None:
-        """Parse the response from the prices query."""
-        if price_data is not None:
-            self.price_data = [Price(price) for price in price_data]
+    def __init__(
+        self,
+        price_data: list[dict] | None = None,
+        field_names: tuple[str, str] | None = None,
+    ) -> None:
+        """Parse the response from the prices query.
+
+        All rows of a response share the same shape, so unless field_names
+        are given they are looked up in the first row only.
+        """
+        if field_names is None and price_data:
+            field_names = _price_field_names(price_data[0])
+
+        self._init_from_list(
+            []
+            if price_data is None
+            else [Price(price, field_names) for price in price_data]
+        )
+
+    def _init_from_list(self, prices: list[Price]) -> PriceData:
+        """Initialize from already parsed prices."""
+        self.price_data = prices
+        return self
 
     def __add__(self, b: PriceData) -> PriceData:
         """Combine two PriceData objects."""
-        pd = PriceData()
-        pd.price_data = self.price_data + b.price_data
-        return pd
+        return PriceData.__new__(PriceData)._init_from_list(
+            [*self.price_data, *b.price_data]
+        )
 
     def __str__(self):
         """Return a string representation of this price data."""
@@ -280,34 +384,47 @@ class PriceData:
         """All prices."""
         return self.price_data
 
+    def chain(self, *others: PriceData) -> Iterator[Price]:
+        """Iterate over these prices followed by the prices of others.
+
+        Unlike adding PriceData objects, no combined list is built.
+        """
+        return itertools.chain(self.price_data, *(other.price_data for other in others))
+
+    def _filter(self, predicate: Callable[[Price, datetime], bool]) -> list[Price]:
+        """Prices matching predicate, using the same 'now' for all of them."""
+        now = datetime.now(timezone.utc)
+        return [hour for hour in self.price_data if predicate(hour, now)]
+
     @property
     def today(self) -> list[Price]:
         """Prices for today."""
-        return [hour for hour in self.price_data if hour.for_today]
+        return self._filter(Price._for_today)
 
     @property
     def current_hour(self) -> Price:
         """Price that's currently applicable."""
-        return [hour for hour in self.price_data if hour.for_now][0]
+        return self._filter(Price._for_now)[0]
 
     @property
     def today_min(self) -> Price:
         """Price with the lowest total for today."""
-        return min([hour for hour in self.today], key=lambda hour: hour.total)
+        return min(self.today, key=_TOTAL)
 
     @property
     def today_max(self) -> Price:
         """Price with the highest total for today."""
-        return max([hour for hour in self.today], key=lambda hour: hour.total)
+        return max(self.today, key=_TOTAL)
 
     @property
     def today_avg(self) -> float:
         """Average price for today."""
-        return round(sum(hour.total for hour in self.today) / len(self.today), 5)
+        today = self.today
+        return round(sum(map(_TOTAL, today)) / len(today), 5)
 
     def get_future_prices(self) -> list[Price]:
         """Prices for hours after the current one."""
-        return [hour for hour in self.price_data if hour.for_future]
+        return self._filter(Price._for_future)
 
     def asdict(self, attr) -> dict:
         """Return a dict that can be used as entity attribute data."""
@@ -317,7 +434,7 @@ class PriceData:
         ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketPrices:
     """Market prices for electricity and gas."""
 
@@ -338,9 +455,14 @@ class MarketPrices:
         payload = data.get("data")
         if not payload:
             raise RequestException("Unexpected response")
-        
-        electricityPayload = payload.get("marketPricesElectricity") if "marketPricesElectricity" in payload else payload.get("marketPrices").get('electricityPrices')
-        gasPayload = payload.get("marketPricesGas") if "marketPricesGas" in payload else payload.get("marketPrices").get('gasPrices')
+
+        if "marketPrices" in payload:
+            payload = payload["marketPrices"]
+            electricityPayload = payload.get("electricityPrices")
+            gasPayload = payload.get("gasPrices")
+        else:
+            electricityPayload = payload.get("marketPricesElectricity")
+            gasPayload = payload.get("marketPricesGas")
 
         return MarketPrices(
             electricity=PriceData(electricityPayload),
@@ -363,8 +485,10 @@ class MarketPrices:
             raise RequestException("Unexpected response")
 
         customerMarketPrices = payload.get("customerMarketPrices")
+        electricityPayload = customerMarketPrices.get("electricityPrices")
+        gasPayload = customerMarketPrices.get("gasPrices")
 
         return MarketPrices(
-            electricity=PriceData(customerMarketPrices.get("electricityPrices")),
-            gas=PriceData(customerMarketPrices.get("gasPrices")),
+            electricity=PriceData(electricityPayload),
+            gas=PriceData(gasPayload),
         )
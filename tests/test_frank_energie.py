@@ -1,12 +1,18 @@
 """Test for Frank Energie."""
 
-from datetime import datetime
+import asyncio
+import json
+import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
 
 import aiohttp
 import pytest
 
 from python_frank_energie import FrankEnergie
 from python_frank_energie.exceptions import AuthException, AuthRequiredException
+from python_frank_energie.frank_energie import _TokenBucket
+from python_frank_energie.models import FrankCountry
 
 from . import load_fixtures
 
@@ -27,6 +33,145 @@ async def test_init_with_authentication():
     assert api.is_authenticated is True
 
 
+@pytest.mark.asyncio
+async def test_query_retries_server_errors(aresponses):
+    """Test that server errors are retried."""
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(text="Service Unavailable", status=503),
+    )
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(
+            text=load_fixtures("user.json"),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session, auth_token="a", refresh_token="b")  # noqa: S106
+        api.RETRY_BASE_DELAY = 0
+        user = await api.user()
+        await api.close()
+
+    assert user.connectionsStatus == "READY"
+
+
+@pytest.mark.asyncio
+async def test_query_mutation_not_retried(aresponses):
+    """Test that mutations are not retried after the server responded."""
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(text="Service Unavailable", status=503),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session, "a", "b")  # noqa: S106
+        api.RETRY_BASE_DELAY = 0
+        with pytest.raises(aiohttp.ClientResponseError) as excinfo:
+            await api.renew_token()
+        await api.close()
+
+    assert excinfo.value.status == 503
+
+
+@pytest.mark.asyncio
+async def test_query_gives_up_after_retries(aresponses):
+    """Test that a request fails once all retries are used."""
+    for _ in range(FrankEnergie.MAX_RETRIES + 1):
+        aresponses.add(
+            SIMPLE_DATA_URL,
+            "/",
+            "POST",
+            aresponses.Response(
+                text="Too Many Requests",
+                status=429,
+                headers={"Retry-After": "0"},
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session)
+        with pytest.raises(aiohttp.ClientResponseError) as excinfo:
+            await api.prices(datetime.utcnow().date(), datetime.utcnow().date())
+        await api.close()
+
+    assert excinfo.value.status == 429
+
+
+@pytest.mark.asyncio
+async def test_query_invalid_json(aresponses):
+    """Test that a response that isn't JSON raises a ValueError."""
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(text="<html></html>", status=200),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session)
+        with pytest.raises(ValueError):
+            await api.login("a", "b")  # noqa: S106
+        await api.close()
+
+
+@pytest.mark.asyncio
+async def test_query_long_retry_after_not_retried(aresponses):
+    """Test that a Retry-After beyond RETRY_MAX_DELAY fails immediately."""
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(
+            text="Too Many Requests",
+            status=429,
+            headers={"Retry-After": "3600"},
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session)
+        with pytest.raises(aiohttp.ClientResponseError) as excinfo:
+            await api.prices(datetime.utcnow().date(), datetime.utcnow().date())
+        await api.close()
+
+    assert excinfo.value.status == 429
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    """Test that the rate limiter waits once its capacity is used."""
+    bucket = _TokenBucket(rate=20, capacity=2)
+
+    start = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    assert time.monotonic() - start < 0.04
+
+    # The bucket is empty, the next token takes 1 / rate seconds to refill
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.045
+
+
+def test_retry_delay():
+    """Test the delay between retries."""
+    api = FrankEnergie()
+    assert api._retry_delay(0, "2") == 2.0
+    assert api._retry_delay(0, "3600") is None
+    assert api._retry_delay(10, None) <= api.RETRY_MAX_DELAY * 1.5
+    assert api._retry_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") <= (
+        api.RETRY_BASE_DELAY * 1.5
+    )
+
+
 #
 # Login tests
 #
@@ -54,6 +199,7 @@ async def test_login(aresponses):
     assert api.is_authenticated is True
     assert auth.authToken == "hello"
     assert auth.refreshToken == "world"
+    assert api._headers["Authorization"] == "Bearer hello"
 
 
 @pytest.mark.asyncio
@@ -295,6 +441,52 @@ async def test_user(aresponses):
     assert user.hasCO2Compensation is False
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_ttl", [900, 0])
+async def test_user_concurrent_requests(aresponses, cache_ttl):
+    """Test that concurrent user requests share a single request."""
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(
+            text=load_fixtures("user.json"),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(
+            session, auth_token="a", refresh_token="b", cache_ttl=cache_ttl  # noqa: S106
+        )
+        first, second = await asyncio.gather(api.user(), api.user())
+        await api.close()
+
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_load_site_reference_once():
+    """Test that concurrent callers only look up the site reference once."""
+    api = FrankEnergie(
+        auth_token="a", refresh_token="b", country=FrankCountry.Belgium  # noqa: S106
+    )
+    calls = 0
+
+    async def user():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return SimpleNamespace(siteReference="site")
+
+    api.user = user
+    await asyncio.gather(*(api._load_site_reference() for _ in range(3)))
+
+    assert calls == 1
+    assert api._siteReference == "site"
+
+
 @pytest.mark.asyncio
 async def test_user_without_authentication(aresponses):
     """Test request without authentication.
@@ -342,6 +534,48 @@ async def test_prices(aresponses):
     assert len(prices.gas.price_data) == 24
 
 
+@pytest.mark.asyncio
+async def test_prices_cached(aresponses):
+    """Test that repeated price requests are served from the cache."""
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(
+            text=load_fixtures("market_prices.json"),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+
+    today = datetime.utcnow().date()
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session)
+        prices = await api.prices(today, today)
+        # Only one response is registered, so this must come from the cache
+        cached_prices = await api.prices(today, today)
+        # Sorting the prices of one caller doesn't change those of the next one
+        prices.electricity.price_data.reverse()
+        cached_prices.electricity.price_data.reverse()
+        next_prices = await api.prices(today, today)
+        await api.close()
+
+    assert cached_prices.electricity.all == prices.electricity.all
+    assert cached_prices.gas.all == prices.gas.all
+    assert next_prices.electricity.all == prices.electricity.all[::-1]
+
+
+def test_cache_drops_expired_entries():
+    """Test that storing a value removes expired cache entries."""
+    api = FrankEnergie(cache_ttl=60)
+    api._cache[("old",)] = (time.monotonic() - 120, "expired")
+    api._cache[("recent",)] = (time.monotonic(), "fresh")
+
+    api._cache_set(("new",), "value")
+
+    assert set(api._cache) == {("recent",), ("new",)}
+
+
 @pytest.mark.asyncio
 async def test_user_prices(aresponses):
     """Test request with authentication.
@@ -369,3 +603,226 @@ async def test_user_prices(aresponses):
 
     assert prices.gas is not None
     assert len(prices.gas.price_data) == 24
+
+
+@pytest.mark.asyncio
+async def test_prices_batch(aresponses):
+    """Test fetching multiple date ranges in a single request."""
+    market_prices = json.loads(load_fixtures("market_prices.json"))["data"]
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(
+            text=json.dumps(
+                {
+                    "data": {
+                        "d0_electricity": market_prices["marketPricesElectricity"],
+                        "d0_gas": market_prices["marketPricesGas"],
+                        "d1_electricity": market_prices["marketPricesElectricity"][:12],
+                        "d1_gas": market_prices["marketPricesGas"][:12],
+                    }
+                }
+            ),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+
+    today = datetime.utcnow().date()
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session)
+        prices_today, prices_tomorrow = await api.prices_batch(
+            [(today, today), (today, today)]
+        )
+        await api.close()
+
+    assert len(prices_today.electricity.price_data) == 24
+    assert len(prices_today.gas.price_data) == 24
+    assert len(prices_tomorrow.electricity.price_data) == 12
+    assert len(prices_tomorrow.gas.price_data) == 12
+
+
+@pytest.mark.asyncio
+async def test_prices_batch_cached(aresponses):
+    """Test that prices_batch only requests ranges that aren't cached."""
+    market_prices = json.loads(load_fixtures("market_prices.json"))["data"]
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(
+            text=load_fixtures("market_prices.json"),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(
+            text=json.dumps(
+                {
+                    "data": {
+                        "d0_electricity": market_prices["marketPricesElectricity"][:12],
+                        "d0_gas": market_prices["marketPricesGas"][:12],
+                    }
+                }
+            ),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+
+    today = datetime.utcnow().date()
+    tomorrow = today + timedelta(days=1)
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session)
+        prices_today = await api.prices(today, tomorrow)
+        # Only tomorrow is requested, today comes from the cache
+        batch = await api.prices_batch([(today, tomorrow), (tomorrow, tomorrow)])
+        # Both ranges are cached now, no request is made
+        cached_batch = await api.prices_batch([(today, tomorrow), (tomorrow, tomorrow)])
+        await api.close()
+
+    assert batch[0].electricity.all == prices_today.electricity.all
+    assert len(batch[1].electricity.price_data) == 12
+    assert [prices.electricity.all for prices in cached_batch] == [
+        prices.electricity.all for prices in batch
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prices_many(aresponses):
+    """Test fetching multiple date ranges with one request per range."""
+    market_prices = json.loads(load_fixtures("market_prices.json"))["data"]
+    hours = {"2023-01-01": 24, "2023-01-02": 12}
+
+    async def handler(request):
+        count = hours[(await request.json())["variables"]["startDate"]]
+        return aresponses.Response(
+            text=json.dumps(
+                {
+                    "data": {
+                        "marketPricesElectricity": market_prices[
+                            "marketPricesElectricity"
+                        ][:count],
+                        "marketPricesGas": market_prices["marketPricesGas"][:count],
+                    }
+                }
+            ),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        )
+
+    aresponses.add(SIMPLE_DATA_URL, "/", "POST", handler)
+    aresponses.add(SIMPLE_DATA_URL, "/", "POST", handler)
+
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session)
+        prices_today, prices_tomorrow = await api.prices_many(
+            [
+                (date(2023, 1, 1), date(2023, 1, 2)),
+                (date(2023, 1, 2), date(2023, 1, 3)),
+            ]
+        )
+        await api.close()
+
+    assert len(prices_today.electricity.price_data) == 24
+    assert len(prices_today.gas.price_data) == 24
+    assert len(prices_tomorrow.electricity.price_data) == 12
+    assert len(prices_tomorrow.gas.price_data) == 12
+
+
+@pytest.mark.asyncio
+async def test_prices_batch_belgium(aresponses):
+    """Test fetching multiple Belgian dates in a single request."""
+    market_prices = json.loads(load_fixtures("market_prices.json"))["data"]
+
+    async def handler(request):
+        body = await request.json()
+        assert body["variables"] == {"date0": "2023-01-01", "date1": "2023-01-02"}
+        assert "d0: marketPrices(date: $date0)" in body["query"]
+        assert "d1: marketPrices(date: $date1)" in body["query"]
+        return aresponses.Response(
+            text=json.dumps(
+                {
+                    "data": {
+                        "d0": {
+                            "electricityPrices": market_prices[
+                                "marketPricesElectricity"
+                            ],
+                            "gasPrices": market_prices["marketPricesGas"],
+                        },
+                        "d1": {
+                            "electricityPrices": market_prices[
+                                "marketPricesElectricity"
+                            ][:12],
+                            "gasPrices": market_prices["marketPricesGas"][:12],
+                        },
+                    }
+                }
+            ),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        )
+
+    aresponses.add(SIMPLE_DATA_URL, "/", "POST", handler)
+
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session, country=FrankCountry.Belgium)
+        prices_today, prices_tomorrow = await api.prices_batch(
+            [(date(2023, 1, 1), None), (date(2023, 1, 2), None)]
+        )
+        await api.close()
+
+    assert len(prices_today.electricity.price_data) == 24
+    assert len(prices_today.gas.price_data) == 24
+    assert len(prices_tomorrow.electricity.price_data) == 12
+    assert len(prices_tomorrow.gas.price_data) == 12
+
+
+@pytest.mark.asyncio
+async def test_prices_batch_missing_prices_for_one_range(aresponses):
+    """Test that an error for one alias doesn't affect the other ranges."""
+    market_prices = json.loads(load_fixtures("market_prices.json"))["data"]
+    aresponses.add(
+        SIMPLE_DATA_URL,
+        "/",
+        "POST",
+        aresponses.Response(
+            text=json.dumps(
+                {
+                    "data": {
+                        "d0_electricity": market_prices["marketPricesElectricity"],
+                        "d0_gas": market_prices["marketPricesGas"],
+                        "d1_electricity": None,
+                        "d1_gas": None,
+                    },
+                    "errors": [
+                        {
+                            "message": "No marketprices found for segment ELECTRICITY",
+                            "path": ["d1_electricity"],
+                        }
+                    ],
+                }
+            ),
+            status=200,
+            headers={"Content-Type": "application/json"},
+        ),
+    )
+
+    today = datetime.utcnow().date()
+    tomorrow = today + timedelta(days=1)
+    async with aiohttp.ClientSession() as session:
+        api = FrankEnergie(session)
+        prices_today, prices_tomorrow = await api.prices_batch(
+            [(today, tomorrow), (tomorrow, tomorrow)]
+        )
+        await api.close()
+
+    assert len(prices_today.electricity.price_data) == 24
+    assert len(prices_today.gas.price_data) == 24
+    assert prices_tomorrow.electricity.price_data == []
+    assert prices_tomorrow.gas.price_data == []
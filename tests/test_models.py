@@ -1,7 +1,7 @@
 """Tests for Frank Energie Models."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 from freezegun import freeze_time
@@ -12,11 +12,41 @@ from python_frank_energie.models import (
     Invoices,
     MarketPrices,
     MonthSummary,
+    Price,
+    PriceData,
     User,
+    _parse_datetime,
 )
 
 from . import load_fixtures
 
+#
+# Tests for timestamp parsing.
+#
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (
+            "2022-11-21T14:00:00.000Z",
+            datetime(2022, 11, 21, 14, tzinfo=timezone.utc),
+        ),
+        ("2022-11-21T14:00:00Z", datetime(2022, 11, 21, 14, tzinfo=timezone.utc)),
+        (
+            "2022-11-21T15:00:00+01:00",
+            datetime(2022, 11, 21, 14, tzinfo=timezone.utc),
+        ),
+        ("2023-03-01T00:00:00", datetime(2023, 3, 1)),
+    ],
+)
+def test_parse_datetime(value, expected):
+    """Test parsing of the timestamps returned by the API."""
+    parsed = _parse_datetime(value)
+    assert parsed == expected
+    assert (parsed.tzinfo is None) == (expected.tzinfo is None)
+
+
 #
 # Tests for Authentication Model.
 #
@@ -44,6 +74,14 @@ def test_authentication_with_unexpected_response():
         Authentication.from_dict({"data": {"login": None}})
 
 
+def test_authentication_with_missing_fields():
+    """Test Authentication.from_dict with fields missing from the payload."""
+    with pytest.raises(AuthException) as excinfo:
+        Authentication.from_dict({"data": {"login": {"authToken": "hello"}}})
+
+    assert "Unexpected response" in str(excinfo.value)
+
+
 def test_authentication_error_message():
     """Test Authentication.from_dict with error message."""
     with pytest.raises(AuthException) as excinfo:
@@ -162,6 +200,45 @@ def test_market_prices_error_message():
     assert "help me" in str(excinfo.value)
 
 
+def test_user_prices_with_raw_field_names():
+    """Test MarketPrices.from_userprices_dict with non-aliased Belgian fields."""
+    rows = [
+        {
+            "from": "2023-05-20T22:00:00.000Z",
+            "till": "2023-05-20T23:00:00.000Z",
+            "marketPrice": 0.05,
+            "marketPriceTax": 0.01,
+            "consumptionSourcingMarkupPrice": 0.02,
+            "energyTax": 0.15,
+        }
+    ]
+    market_prices = MarketPrices.from_userprices_dict(
+        {"data": {"customerMarketPrices": {"electricityPrices": rows, "gasPrices": []}}}
+    )
+
+    price = market_prices.electricity.all[0]
+    assert price.sourcing_markup_price == 0.02
+    assert price.energy_tax_price == 0.15
+    assert price.total == 0.23
+    assert market_prices.gas.all == []
+
+
+def test_pricedata_with_raw_field_names():
+    """Test PriceData and Price built directly from non-aliased Belgian rows."""
+    row = {
+        "from": "2023-05-20T22:00:00.000Z",
+        "till": "2023-05-20T23:00:00.000Z",
+        "marketPrice": 0.05,
+        "marketPriceTax": 0.01,
+        "consumptionSourcingMarkupPrice": 0.02,
+        "energyTax": 0.15,
+    }
+
+    price_data = PriceData([row, {**row, "marketPrice": 0.06}])
+    assert [price.total for price in price_data.all] == [0.23, 0.24]
+    assert Price(row).energy_tax_price == 0.15
+
+
 @freeze_time("2022-11-21 14:15:00")
 def test_market_prices_pricedata_current_hour():
     """Test functionality of MarketPrices.price_data."""
@@ -184,6 +261,47 @@ def test_market_prices_pricedata_current_hour():
     assert market_prices.electricity.today_avg == 11.2175
 
 
+@freeze_time("2022-11-21 14:15:00")
+def test_market_prices_pricedata_combined():
+    """Test aggregates on combined PriceData objects."""
+    market_prices = MarketPrices.from_dict(
+        json.loads(load_fixtures("market_prices.json"))
+    )
+
+    combined = market_prices.electricity + market_prices.gas
+    assert len(combined.all) == 48
+    assert list(market_prices.electricity.chain(market_prices.gas)) == combined.all
+    assert combined.today_min.total == min(price.total for price in combined.all)
+    assert combined.today_max.total == max(price.total for price in combined.all)
+
+
+@freeze_time("2022-11-21 14:15:00")
+def test_market_prices_pricedata_modified_prices():
+    """Test that aggregates follow changes to price_data."""
+    market_prices = MarketPrices.from_dict(
+        json.loads(load_fixtures("market_prices.json"))
+    )
+
+    electricity = market_prices.electricity
+    electricity.price_data.sort(key=lambda price: price.total, reverse=True)
+    assert electricity.today_min.total == 10.0
+    assert electricity.today_max.total == 13.996
+
+    replaced = PriceData()
+    replaced.price_data = list(electricity.price_data)
+    assert replaced.today_min.total == 10.0
+
+
+def test_pricedata_instances_do_not_share_prices():
+    """Test that empty PriceData objects don't share their price list."""
+    first = PriceData()
+    second = PriceData()
+    first.price_data.append(None)
+
+    assert first.price_data is not second.price_data
+    assert second.price_data == []
+
+
 @freeze_time("2022-11-21 14:15:00")
 def test_market_prices_pricedata_next_hour():
     """Test functionality of MarketPrices.price_data."""
@@ -228,6 +346,29 @@ def test_invoices_with_missing_parameters():
     assert "Unexpected response" in str(excinfo.value)
 
 
+def test_invoices_with_missing_fields():
+    """Test Invoices.from_dict with fields missing from the payload."""
+    with pytest.raises(RequestException) as excinfo:
+        Invoices.from_dict({"data": {"invoices": {"previousPeriodInvoice": None}}})
+
+    assert "Unexpected response" in str(excinfo.value)
+
+    with pytest.raises(RequestException) as excinfo:
+        Invoices.from_dict(
+            {
+                "data": {
+                    "invoices": {
+                        "previousPeriodInvoice": {"StartDate": "2023-03-01T00:00:00"},
+                        "currentPeriodInvoice": None,
+                        "upcomingPeriodInvoice": None,
+                    }
+                }
+            }
+        )
+
+    assert "Unexpected response" in str(excinfo.value)
+
+
 def test_invoices_error_message():
     """Test Invoices.from_dict with error message."""
     with pytest.raises(RequestException) as excinfo: